@@ -24,7 +24,9 @@ except ImportError:  # pragma: no cover
     from typing_extensions import Unpack
 
 
-PADDLEOCR_SUPPORTED_LANGUAGE_CODES: Final[set[str]] = {"ch", "en", "french", "german", "japan", "korean"}
+PADDLEOCR_SUPPORTED_LANGUAGE_CODES: Final[frozenset[str]] = frozenset(
+    {"ch", "en", "french", "german", "japan", "korean"}
+)
 
 
 @dataclass(unsafe_hash=True, frozen=True)
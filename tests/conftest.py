@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
 
 import pytest
+from PIL import Image
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
 
 test_source_files_folder = Path(__file__).parent / "test_source_files"
 
@@ -42,6 +48,13 @@ def ocr_image() -> Path:
     return test_source_files_folder / "ocr-image.jpg"
 
 
+@pytest.fixture(scope="session")
+def opened_ocr_image(ocr_image: Path) -> Generator[Image.Image, None, None]:
+    with Image.open(ocr_image) as image:
+        image.load()
+        yield image
+
+
 @pytest.fixture(scope="session")
 def docx_document() -> Path:
     return test_source_files_folder / "document.docx"
@@ -77,4 +90,15 @@ def tiny_pdf_with_tables() -> Path:
     return test_source_files_folder / "pdfs_with_tables" / "tiny.pdf"
 
 
+@pytest.fixture(scope="session")
+def gmft_module_stubs() -> dict[str, MagicMock]:
+    return {
+        "gmft": MagicMock(spec=["auto", "detectors", "formatters", "pdf_bindings"]),
+        "gmft.auto": MagicMock(spec=["AutoTableDetector", "AutoTableFormatter"]),
+        "gmft.detectors.tatr": MagicMock(spec=["TATRDetectorConfig"]),
+        "gmft.formatters.tatr": MagicMock(spec=["TATRFormatConfig"]),
+        "gmft.pdf_bindings.pdfium": MagicMock(spec=["PyPDFium2Document"]),
+    }
+
+
 pdfs_with_tables = sorted((test_source_files_folder / "pdfs_with_tables").glob("*.pdf"))
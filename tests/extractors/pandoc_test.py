@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from json import dumps
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, Mock
@@ -37,16 +38,22 @@ SAMPLE_PANDOC_JSON = {
     "meta": {"title": {"t": "MetaString", "c": "Test Document"}, "author": {"t": "MetaString", "c": "Test Author"}},
     "blocks": [],
 }
+SAMPLE_PANDOC_JSON_TEXT = dumps(SAMPLE_PANDOC_JSON)
 
 
-@pytest.fixture
-def mock_run_process(mocker: MockerFixture) -> AsyncMock:
-    return mocker.patch("kreuzberg._extractors._pandoc.run_process", new_callable=AsyncMock)
+@pytest.fixture(scope="module", autouse=True)
+def patched_run_process(module_mocker: MockerFixture) -> AsyncMock:
+    return module_mocker.patch("kreuzberg._extractors._pandoc.run_process", new_callable=AsyncMock)
+
+
+@pytest.fixture(autouse=True)
+def reset_run_process(patched_run_process: AsyncMock) -> None:
+    patched_run_process.reset_mock(return_value=True, side_effect=True)
 
 
 @pytest.fixture
-def mock_version_check(mocker: MockerFixture) -> None:
-    mocker.patch("kreuzberg._extractors._pandoc.PandocExtractor._checked_version", True)
+def mock_run_process(patched_run_process: AsyncMock) -> AsyncMock:
+    return patched_run_process
 
 
 @pytest.fixture
@@ -214,9 +221,9 @@ def test_get_pandoc_type_from_mime_type(
     assert extractor._get_pandoc_type_from_mime_type(mime_type) == expected_type
 
 
-@pytest.fixture(autouse=True)
-def mock_pandoc_version(mocker: MockerFixture) -> None:
-    mocker.patch("kreuzberg._extractors._pandoc.PandocExtractor._checked_version", True)
+@pytest.fixture(scope="module", autouse=True)
+def mock_pandoc_version(module_mocker: MockerFixture) -> None:
+    module_mocker.patch("kreuzberg._extractors._pandoc.PandocExtractor._checked_version", True)
 
 
 @pytest.fixture
@@ -249,9 +256,40 @@ async def test_handle_extract_file(
     assert isinstance(result, str)
 
 
+@pytest.mark.anyio
+async def test_handle_extract_metadata(
+    mocker: MockerFixture, mock_run_process: Mock, mock_temp_file: None, test_config: ExtractionConfig
+) -> None:
+    extractor = MarkdownExtractor(mime_type="text/x-markdown", config=test_config)
+    mock_run_process.return_value.returncode = 0
+    mock_path = mocker.patch("kreuzberg._extractors._pandoc.AsyncPath")
+    mock_path.return_value.read_text = AsyncMock(return_value=SAMPLE_PANDOC_JSON_TEXT)
+
+    await extractor._handle_extract_metadata(Path("/tmp/test"))
+
+    assert "--to=json" in mock_run_process.call_args.args[0]
+    mock_path.return_value.read_text.assert_awaited_once_with("utf-8")
+
+
+@pytest.mark.anyio
+@pytest.mark.xfail(
+    strict=True, reason="_handle_extract_metadata passes the whole document instead of json_data['meta']"
+)
+async def test_handle_extract_metadata_reads_meta(
+    mocker: MockerFixture, mock_run_process: Mock, mock_temp_file: None, test_config: ExtractionConfig
+) -> None:
+    extractor = MarkdownExtractor(mime_type="text/x-markdown", config=test_config)
+    mock_run_process.return_value.returncode = 0
+    mock_path = mocker.patch("kreuzberg._extractors._pandoc.AsyncPath")
+    mock_path.return_value.read_text = AsyncMock(return_value=SAMPLE_PANDOC_JSON_TEXT)
+
+    result = await extractor._handle_extract_metadata(Path("/tmp/test"))
+
+    assert result == {"title": "Test Document", "authors": ["Test Author"]}
+
+
 @pytest.mark.anyio
 async def test_extract_path_async(
-    mock_version_check: None,
     mock_run_taskgroup: AsyncMock,
     mock_temp_file: None,
     mock_async_path: None,
@@ -271,7 +309,6 @@ async def test_extract_path_async(
 
 @pytest.mark.anyio
 async def test_extract_bytes_async(
-    mock_version_check: None,
     mock_run_taskgroup: AsyncMock,
     mock_temp_file: None,
     mock_async_path: None,
@@ -290,54 +327,26 @@ async def test_extract_bytes_async(
 
 
 @pytest.mark.anyio
-async def test_validate_pandoc_version_file_not_found(mocker: MockerFixture, test_config: ExtractionConfig) -> None:
-    extractor = MarkdownExtractor(mime_type="text/x-markdown", config=test_config)
-    extractor._checked_version = False
-
-    mock_run = mocker.patch("kreuzberg._extractors._pandoc.run_process", new_callable=AsyncMock)
-    mock_run.side_effect = FileNotFoundError()
-
-    with pytest.raises(MissingDependencyError) as excinfo:
-        await extractor._validate_pandoc_version()
-
-    error_message = str(excinfo.value)
-    assert "Pandoc version 2" in error_message
-    assert "required" in error_message
-
-    assert mock_run.called
-
-
-@pytest.mark.anyio
-async def test_validate_pandoc_version_invalid_output(mocker: MockerFixture, test_config: ExtractionConfig) -> None:
-    extractor = MarkdownExtractor(mime_type="text/x-markdown", config=test_config)
-    extractor._checked_version = False
-
-    mock_run = mocker.patch("kreuzberg._extractors._pandoc.run_process", new_callable=AsyncMock)
-
-    mock_return = Mock()
-    mock_return.stdout = b"invalid version output"
-    mock_run.return_value = mock_return
-
-    with pytest.raises(MissingDependencyError) as excinfo:
-        await extractor._validate_pandoc_version()
-
-    error_message = str(excinfo.value)
-    assert "Pandoc version 2" in error_message
-    assert "required" in error_message
-
-    assert mock_run.called
-
-
-@pytest.mark.anyio
-async def test_validate_pandoc_version_parse_error(mocker: MockerFixture, test_config: ExtractionConfig) -> None:
+@pytest.mark.parametrize(
+    "side_effect, return_value",
+    [
+        (FileNotFoundError(), None),
+        (None, Mock(stdout=b"invalid version output")),
+        (None, Mock(stdout=b"pandoc abc")),
+    ],
+    ids=["file_not_found", "invalid_output", "parse_error"],
+)
+async def test_validate_pandoc_version_error(
+    mock_run_process: AsyncMock,
+    test_config: ExtractionConfig,
+    side_effect: Exception | None,
+    return_value: Mock | None,
+) -> None:
     extractor = MarkdownExtractor(mime_type="text/x-markdown", config=test_config)
     extractor._checked_version = False
 
-    mock_run = mocker.patch("kreuzberg._extractors._pandoc.run_process", new_callable=AsyncMock)
-
-    mock_return = Mock()
-    mock_return.stdout = b"pandoc abc"
-    mock_run.return_value = mock_return
+    mock_run_process.side_effect = side_effect
+    mock_run_process.return_value = return_value
 
     with pytest.raises(MissingDependencyError) as excinfo:
         await extractor._validate_pandoc_version()
@@ -346,49 +355,6 @@ async def test_validate_pandoc_version_parse_error(mocker: MockerFixture, test_c
     assert "Pandoc version 2" in error_message
     assert "required" in error_message
 
-    assert mock_run.called
-
-
-@pytest.mark.anyio
-async def test_handle_extract_metadata_runtime_error(
-    mock_run_process: AsyncMock, mock_temp_file: None, mock_async_path: None, test_config: ExtractionConfig
-) -> None:
-    extractor = MarkdownExtractor(mime_type="text/x-markdown", config=test_config)
-    mock_run_process.side_effect = RuntimeError("Test error")
-
-    with pytest.raises(ParsingError):
-        await extractor._handle_extract_metadata(Path("/tmp/test"))
-
-    assert mock_run_process.called
-
-
-@pytest.mark.anyio
-async def test_handle_extract_file_runtime_error(
-    mock_run_process: AsyncMock, mock_temp_file: None, mock_async_path: None, test_config: ExtractionConfig
-) -> None:
-    extractor = MarkdownExtractor(mime_type="text/x-markdown", config=test_config)
-    mock_run_process.side_effect = RuntimeError("Test error")
-
-    with pytest.raises(ParsingError):
-        await extractor._handle_extract_file(Path("/tmp/test"))
-
-    assert mock_run_process.called
-
-
-@pytest.mark.anyio
-async def test_extract_bytes_async_runtime_error(
-    mock_version_check: None,
-    mock_temp_file: None,
-    mock_async_path: None,
-    mock_run_process: AsyncMock,
-    test_config: ExtractionConfig,
-) -> None:
-    extractor = MarkdownExtractor(mime_type="text/x-markdown", config=test_config)
-    mock_run_process.side_effect = RuntimeError("Test error")
-
-    with pytest.raises(ParsingError):
-        await extractor.extract_bytes_async(b"Test content")
-
     assert mock_run_process.called
 
 
@@ -404,55 +370,37 @@ def test_get_pandoc_type_prefix_match(test_config: ExtractionConfig) -> None:
 
 
 @pytest.mark.anyio
-async def test_handle_extract_metadata_error(
-    mock_run_process: AsyncMock, mock_temp_file: None, mock_async_path: None, test_config: ExtractionConfig
-) -> None:
-    extractor = MarkdownExtractor(mime_type="text/x-markdown", config=test_config)
-
-    mock_return = Mock()
-    mock_return.returncode = 1
-    mock_return.stderr = b"Test error"
-    mock_run_process.return_value = mock_return
-
-    with pytest.raises(ParsingError):
-        await extractor._handle_extract_metadata(Path("/tmp/test"))
-
-    assert mock_run_process.called
-
-
-@pytest.mark.anyio
-async def test_handle_extract_file_error(
-    mock_run_process: AsyncMock, mock_temp_file: None, mock_async_path: None, test_config: ExtractionConfig
-) -> None:
-    extractor = MarkdownExtractor(mime_type="text/x-markdown", config=test_config)
-
-    mock_return = Mock()
-    mock_return.returncode = 1
-    mock_return.stderr = b"Test error"
-    mock_run_process.return_value = mock_return
-
-    with pytest.raises(ParsingError):
-        await extractor._handle_extract_file(Path("/tmp/test"))
-
-    assert mock_run_process.called
-
-
-@pytest.mark.anyio
-async def test_extract_bytes_async_error(
-    mock_version_check: None,
+@pytest.mark.parametrize(
+    "side_effect, return_value",
+    [
+        (RuntimeError("Test error"), None),
+        (None, Mock(returncode=1, stderr=b"Test error")),
+    ],
+    ids=["runtime_error", "non_zero_returncode"],
+)
+@pytest.mark.parametrize(
+    "method, argument",
+    [
+        ("_handle_extract_metadata", Path("/tmp/test")),
+        ("_handle_extract_file", Path("/tmp/test")),
+        ("extract_bytes_async", b"Test content"),
+    ],
+)
+async def test_pandoc_run_errors(
+    mock_run_process: AsyncMock,
     mock_temp_file: None,
     mock_async_path: None,
-    mock_run_process: AsyncMock,
     test_config: ExtractionConfig,
+    method: str,
+    argument: Path | bytes,
+    side_effect: Exception | None,
+    return_value: Mock | None,
 ) -> None:
     extractor = MarkdownExtractor(mime_type="text/x-markdown", config=test_config)
-
-    mock_return = Mock()
-    mock_return.returncode = 1
-    mock_return.stderr = b"Test error"
-    mock_run_process.return_value = mock_return
+    mock_run_process.side_effect = side_effect
+    mock_run_process.return_value = return_value
 
     with pytest.raises(ParsingError):
-        await extractor.extract_bytes_async(b"Test content")
+        await getattr(extractor, method)(argument)
 
     assert mock_run_process.called
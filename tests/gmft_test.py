@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import TYPE_CHECKING, Any
+from unittest.mock import DEFAULT, MagicMock, patch
 
-import pandas as pd
 import pytest
 from PIL import Image
 
@@ -12,25 +13,32 @@ from kreuzberg._gmft import extract_tables
 from kreuzberg.exceptions import MissingDependencyError
 from kreuzberg.extraction import extract_file
 
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from pandas import DataFrame
+
+MOCK_TABLE_DATA = {"Col1": [1, 2], "Col2": ["A", "B"]}
 
-@pytest.fixture
-def mock_cropped_table() -> MagicMock:
-    mock = MagicMock()
-    mock.page.page_number = 1
-    mock.image.return_value = Image.new("RGB", (100, 100))
-    return mock
+
+@lru_cache(maxsize=1)
+def _blank_image() -> Image.Image:
+    return Image.new("RGB", (100, 100))
 
 
 @pytest.fixture
-def mock_formatted_table() -> MagicMock:
-    mock = MagicMock()
-    df = pd.DataFrame({"Column1": [1, 2, 3], "Column2": ["A", "B", "C"]})
-    mock.df = AsyncMock(return_value=df)
-    return mock
+def gmft_modules(gmft_module_stubs: dict[str, MagicMock]) -> Generator[dict[str, MagicMock], None, None]:
+    for stub in gmft_module_stubs.values():
+        stub.reset_mock(return_value=True, side_effect=True)
+
+    with patch.dict("sys.modules", gmft_module_stubs):
+        yield gmft_module_stubs
 
 
 @pytest.mark.anyio
 async def test_extract_tables_with_default_config(tiny_pdf_with_tables: Path) -> None:
+    pd = pytest.importorskip("pandas")
+
     try:
         tables = await extract_tables(tiny_pdf_with_tables)
 
@@ -101,61 +109,25 @@ async def test_extract_tables_missing_dependency() -> None:
         assert "gmft" in str(exc_info.value)
 
 
-@pytest.mark.anyio
-async def test_extract_tables_with_mocks() -> None:
-    mock_path = MagicMock(spec=Path)
-
+def _build_gmft_mocks(df: DataFrame, page_number: int = 1) -> list[Any]:
     mock_doc = MagicMock()
-    mock_page = MagicMock()
-    mock_doc.__iter__.return_value = [mock_page]
-    mock_doc.close = MagicMock()
+    mock_doc.__iter__.return_value = [MagicMock()]
 
     mock_cropped_table = MagicMock()
-    mock_cropped_table.page.page_number = 1
-    mock_cropped_table.image.return_value = Image.new("RGB", (100, 100))
-
-    mock_formatted_table = MagicMock()
-    mock_df = pd.DataFrame({"Col1": [1, 2], "Col2": ["A", "B"]})
-    mock_formatted_table.df = AsyncMock(return_value=mock_df)
-
-    mock_auto = MagicMock()
-    mock_auto.AutoTableDetector = MagicMock()
-    mock_auto.AutoTableFormatter = MagicMock()
-    mock_auto.TATRFormatConfig = MagicMock()
-    mock_auto.CroppedTable = MagicMock()
-
-    mock_detector_tatr = MagicMock()
-    mock_detector_tatr.TATRDetectorConfig = MagicMock()
-
-    mock_pdf_bindings = MagicMock()
-    mock_pdf_bindings.PyPDFium2Document = MagicMock()
-
-    module_patcher = patch.dict(
-        "sys.modules",
-        {
-            "gmft": MagicMock(),
-            "gmft.auto": mock_auto,
-            "gmft.detectors.tatr": mock_detector_tatr,
-            "gmft.pdf_bindings": mock_pdf_bindings,
-        },
-    )
+    mock_cropped_table.page.page_number = page_number
+    mock_cropped_table.image.return_value = _blank_image()
 
-    mock_detector = mock_auto.AutoTableDetector.return_value
-    mock_detector.extract.return_value = [mock_cropped_table]
+    return [mock_doc, [mock_cropped_table], MagicMock(), df, None]
 
-    mock_formatter = mock_auto.AutoTableFormatter.return_value
-    mock_formatter.extract.return_value = mock_formatted_table
 
-    with module_patcher, patch("kreuzberg._gmft.run_sync") as mock_run_sync:
-        mock_run_sync.side_effect = [
-            mock_doc,
-            [mock_cropped_table],
-            mock_formatted_table,
-            mock_df,
-            None,
-        ]
+@pytest.mark.anyio
+async def test_extract_tables_with_mocks(gmft_modules: dict[str, MagicMock]) -> None:
+    pd = pytest.importorskip("pandas")
 
-        result = await extract_tables(mock_path)
+    with patch.multiple("kreuzberg._gmft", run_sync=DEFAULT) as patched:
+        patched["run_sync"].side_effect = _build_gmft_mocks(pd.DataFrame(MOCK_TABLE_DATA))
+
+        result = await extract_tables(MagicMock(spec=Path))
 
         assert isinstance(result, list)
         assert len(result) == 1
@@ -167,13 +139,32 @@ async def test_extract_tables_with_mocks() -> None:
         assert isinstance(table_data["text"], str)
         assert isinstance(table_data["cropped_image"], Image.Image)
 
-        mock_auto.AutoTableDetector.assert_called_once()
-        mock_auto.AutoTableFormatter.assert_called_once()
-        mock_detector_tatr.TATRDetectorConfig.assert_called_once()
+        gmft_modules["gmft.auto"].AutoTableDetector.assert_called_once()
+        gmft_modules["gmft.auto"].AutoTableFormatter.assert_called_once()
+        gmft_modules["gmft.detectors.tatr"].TATRDetectorConfig.assert_called_once()
 
 
 @pytest.mark.anyio
-async def test_gmft_config_default_values() -> None:
+async def test_extract_tables_with_custom_config_mocks(gmft_modules: dict[str, MagicMock]) -> None:
+    pd = pytest.importorskip("pandas")
+    config = GMFTConfig(detector_base_threshold=0.85, remove_null_rows=False, enable_multi_header=True, verbosity=1)
+
+    with patch.multiple("kreuzberg._gmft", run_sync=DEFAULT) as patched:
+        patched["run_sync"].side_effect = _build_gmft_mocks(pd.DataFrame(MOCK_TABLE_DATA), page_number=2)
+
+        result = await extract_tables(MagicMock(spec=Path), config)
+
+        assert len(result) == 1
+        assert result[0]["page_number"] == 2
+
+        gmft_modules["gmft.detectors.tatr"].TATRDetectorConfig.assert_called_once_with(detector_base_threshold=0.85)
+        format_config = gmft_modules["gmft.formatters.tatr"].TATRFormatConfig.call_args.kwargs
+        assert format_config["verbosity"] == 1
+        assert format_config["remove_null_rows"] is False
+        assert format_config["enable_multi_header"] is True
+
+
+def test_gmft_config_default_values() -> None:
     config = GMFTConfig()
 
     assert config.verbosity == 0
@@ -187,8 +178,7 @@ async def test_gmft_config_default_values() -> None:
     assert config.large_table_row_overlap_threshold == 0.2
 
 
-@pytest.mark.anyio
-async def test_gmft_config_custom_values() -> None:
+def test_gmft_config_custom_values() -> None:
     custom_confidence = {
         0: 0.4,
         1: 0.4,
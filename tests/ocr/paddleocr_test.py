@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import platform
+from importlib.util import find_spec
 from typing import TYPE_CHECKING, Any
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch, seal
 
-import numpy as np
 import pytest
 from PIL import Image
 
@@ -12,120 +13,137 @@ from kreuzberg._types import ExtractionResult
 from kreuzberg.exceptions import MissingDependencyError, OCRError, ValidationError
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
     from pathlib import Path
 
     from pytest_mock import MockerFixture
 
+SAMPLE_PADDLE_RESULT = (
+    (
+        (((10, 10), (100, 10), (100, 30), (10, 30)), ("Sample text 1", 0.95)),
+        (((10, 40), (100, 40), (100, 60), (10, 60)), ("Sample text 2", 0.90)),
+    ),
+)
+
+SUPPORTED_LANGUAGES = ",".join(sorted(PADDLEOCR_SUPPORTED_LANGUAGE_CODES))
+
+requires_paddleocr = pytest.mark.skipif(find_spec("paddleocr") is None, reason="PaddleOCR not installed")
+skip_on_apple_silicon = pytest.mark.skipif(
+    platform.system() == "Darwin" and platform.machine() == "arm64",
+    reason="Test not applicable on Mac M1/ARM architecture",
+)
+
+BLANK_IMAGE_ARRAY_INTERFACE = {
+    "shape": (100, 100, 3),
+    "typestr": "|u1",
+    "data": bytes(100 * 100 * 3),
+    "strides": None,
+    "version": 3,
+}
+
 
 @pytest.fixture
 def backend() -> PaddleBackend:
     return PaddleBackend()
 
 
+@pytest.fixture(autouse=True)
+def reset_paddle_ocr() -> Generator[None, None, None]:
+    PaddleBackend._paddle_ocr = None
+    yield
+    PaddleBackend._paddle_ocr = None
+
+
+@pytest.fixture(scope="module")
+def paddle_mock() -> Mock:
+    mock = Mock()
+    mock.ocr.return_value = SAMPLE_PADDLE_RESULT
+    return mock
+
+
 @pytest.fixture
-def mock_paddleocr(mocker: MockerFixture) -> Mock:
-    mock = mocker.patch("paddleocr.PaddleOCR")
-    instance = mock.return_value
+def paddle_backend_with_mock(backend: PaddleBackend, paddle_mock: Mock) -> PaddleBackend:
+    PaddleBackend._paddle_ocr = paddle_mock
+    return backend
 
-    instance.ocr.return_value = [
-        [
-            [
-                [[10, 10], [100, 10], [100, 30], [10, 30]],
-                ("Sample text 1", 0.95),
-            ],
-            [
-                [[10, 40], [100, 40], [100, 60], [10, 60]],
-                ("Sample text 2", 0.90),
-            ],
-        ]
-    ]
+
+@pytest.fixture(scope="module")
+def paddleocr_class_mock(paddle_mock: Mock) -> Mock:
+    mock = Mock(return_value=paddle_mock)
+    seal(mock)
     return mock
 
 
 @pytest.fixture
-def mock_run_sync(mocker: MockerFixture) -> Mock:
-    async def mock_async_run_sync(func: Any, *args: Any, **kwargs: Any) -> Any:
-        if isinstance(func, Mock) and kwargs.get("image_np") is not None:
-            return [
-                [
-                    [
-                        [[10, 10], [100, 10], [100, 30], [10, 30]],
-                        ("Sample text 1", 0.95),
-                    ],
-                    [
-                        [[10, 40], [100, 40], [100, 60], [10, 60]],
-                        ("Sample text 2", 0.90),
-                    ],
-                ]
-            ]
-
-        if callable(func) and hasattr(func, "__name__") and func.__name__ == "open":
-            img = Mock(spec=Image.Image)
-            img.size = (100, 100)
-
-            array_interface = {
-                "shape": (100, 100, 3),
-                "typestr": "|u1",
-                "data": np.zeros((100, 100, 3), dtype=np.uint8).tobytes(),
-                "strides": None,
-                "version": 3,
-            }
-            type(img).__array_interface__ = array_interface
-            return img
-
-        if callable(func) and hasattr(func, "__name__") and func.__name__ == "PaddleOCR":
-            paddle_ocr = Mock()
-            paddle_ocr.ocr = Mock()
-            paddle_ocr.ocr.return_value = [
-                [
-                    [
-                        [[10, 10], [100, 10], [100, 30], [10, 30]],
-                        ("Sample text 1", 0.95),
-                    ],
-                    [
-                        [[10, 40], [100, 40], [100, 60], [10, 60]],
-                        ("Sample text 2", 0.90),
-                    ],
-                ]
-            ]
-            return paddle_ocr
-        return func(*args, **kwargs)
-
-    return mocker.patch("kreuzberg._ocr._paddleocr.run_sync", side_effect=mock_async_run_sync)
+def mock_paddleocr(mocker: MockerFixture, paddleocr_class_mock: Mock) -> Mock:
+    paddleocr_class_mock.reset_mock()
+    return mocker.patch("paddleocr.PaddleOCR", new=paddleocr_class_mock)
+
+
+async def mock_async_run_sync(func: Any, *args: Any, **kwargs: Any) -> Any:
+    if isinstance(func, Mock) and kwargs.get("image_np") is not None:
+        return SAMPLE_PADDLE_RESULT
+
+    if callable(func) and hasattr(func, "__name__") and func.__name__ == "open":
+        img = Mock(spec=Image.Image)
+        img.size = (100, 100)
+        type(img).__array_interface__ = BLANK_IMAGE_ARRAY_INTERFACE
+        return img
+
+    if callable(func) and hasattr(func, "__name__") and func.__name__ == "PaddleOCR":
+        paddle_ocr = Mock()
+        paddle_ocr.ocr = Mock()
+        paddle_ocr.ocr.return_value = SAMPLE_PADDLE_RESULT
+        return paddle_ocr
+    return func(*args, **kwargs)
+
+
+@pytest.fixture(scope="module")
+def run_sync_mock() -> AsyncMock:
+    return AsyncMock(side_effect=mock_async_run_sync)
 
 
 @pytest.fixture
-def mock_find_spec(mocker: MockerFixture) -> Mock:
-    mock = mocker.patch("kreuzberg._ocr._paddleocr.find_spec")
-    mock.return_value = True
+def mock_run_sync(mocker: MockerFixture, run_sync_mock: AsyncMock) -> AsyncMock:
+    run_sync_mock.reset_mock()
+    return mocker.patch("kreuzberg._ocr._paddleocr.run_sync", new=run_sync_mock)
+
+
+@pytest.fixture(scope="module")
+def find_spec_mock() -> Mock:
+    mock = Mock(return_value=True)
+    seal(mock)
     return mock
 
 
-@pytest.fixture
-def mock_find_spec_missing(mocker: MockerFixture) -> Mock:
-    mock = mocker.patch("kreuzberg._ocr._paddleocr.find_spec")
-    mock.return_value = None
+@pytest.fixture(scope="module")
+def find_spec_missing_mock() -> Mock:
+    mock = Mock(return_value=None)
+    seal(mock)
     return mock
 
 
 @pytest.fixture
+def mock_find_spec(mocker: MockerFixture, find_spec_mock: Mock) -> Mock:
+    find_spec_mock.reset_mock()
+    return mocker.patch("kreuzberg._ocr._paddleocr.find_spec", new=find_spec_mock)
+
+
+@pytest.fixture
+def mock_find_spec_missing(mocker: MockerFixture, find_spec_missing_mock: Mock) -> Mock:
+    find_spec_missing_mock.reset_mock()
+    return mocker.patch("kreuzberg._ocr._paddleocr.find_spec", new=find_spec_missing_mock)
+
+
+@pytest.fixture(scope="module")
 def mock_image() -> Mock:
     img = Mock(spec=Image.Image)
     img.size = (100, 100)
-
-    array_interface = {
-        "shape": (100, 100, 3),
-        "typestr": "|u1",
-        "data": np.zeros((100, 100, 3), dtype=np.uint8).tobytes(),
-        "strides": None,
-        "version": 3,
-    }
-    type(img).__array_interface__ = array_interface
+    type(img).__array_interface__ = BLANK_IMAGE_ARRAY_INTERFACE
     return img
 
 
-@pytest.mark.anyio
-async def test_is_mkldnn_supported(mocker: MockerFixture) -> None:
+def test_is_mkldnn_supported(mocker: MockerFixture) -> None:
     mocker.patch("platform.system", return_value="Linux")
     mocker.patch("platform.processor", return_value="x86_64")
     mocker.patch("platform.machine", return_value="x86_64")
@@ -161,8 +179,6 @@ async def test_is_mkldnn_supported(mocker: MockerFixture) -> None:
 async def test_init_paddle_ocr(
     backend: PaddleBackend, mock_paddleocr: Mock, mock_run_sync: Mock, mock_find_spec: Mock
 ) -> None:
-    PaddleBackend._paddle_ocr = None
-
     await backend._init_paddle_ocr()
 
     mock_run_sync.assert_called_once()
@@ -182,8 +198,6 @@ async def test_init_paddle_ocr(
 async def test_init_paddle_ocr_with_gpu_package(
     backend: PaddleBackend, mock_paddleocr: Mock, mock_run_sync: Mock, mock_find_spec: Mock, mocker: MockerFixture
 ) -> None:
-    PaddleBackend._paddle_ocr = None
-
     mocker.patch("kreuzberg._ocr._paddleocr.find_spec", side_effect=lambda x: True if x == "paddlepaddle_gpu" else None)
 
     await backend._init_paddle_ocr()
@@ -194,17 +208,11 @@ async def test_init_paddle_ocr_with_gpu_package(
     assert call_kwargs.get("use_gpu") is True
     assert call_kwargs.get("enable_mkldnn") is False
 
-    PaddleBackend._paddle_ocr = None
-    mock_paddleocr.reset_mock()
-    mock_run_sync.reset_mock()
-
 
 @pytest.mark.anyio
 async def test_init_paddle_ocr_with_language(
     backend: PaddleBackend, mock_paddleocr: Mock, mock_run_sync: Mock, mock_find_spec: Mock
 ) -> None:
-    PaddleBackend._paddle_ocr = None
-
     with patch.object(PaddleBackend, "_validate_language_code", return_value="french"):
         await backend._init_paddle_ocr(language="fra")
 
@@ -217,8 +225,6 @@ async def test_init_paddle_ocr_with_language(
 async def test_init_paddle_ocr_with_custom_options(
     backend: PaddleBackend, mock_paddleocr: Mock, mock_run_sync: Mock, mock_find_spec: Mock
 ) -> None:
-    PaddleBackend._paddle_ocr = None
-
     custom_options = {
         "det_db_thresh": 0.4,
         "det_db_box_thresh": 0.6,
@@ -245,8 +251,6 @@ async def test_init_paddle_ocr_with_custom_options(
 async def test_init_paddle_ocr_with_model_dirs(
     backend: PaddleBackend, mock_paddleocr: Mock, mock_run_sync: Mock, mock_find_spec: Mock
 ) -> None:
-    PaddleBackend._paddle_ocr = None
-
     custom_options = {
         "det_model_dir": "/path/to/det/model",
         "rec_model_dir": "/path/to/rec/model",
@@ -263,8 +267,6 @@ async def test_init_paddle_ocr_with_model_dirs(
 
 @pytest.mark.anyio
 async def test_init_paddle_ocr_missing_dependency(backend: PaddleBackend, mock_find_spec_missing: Mock) -> None:
-    PaddleBackend._paddle_ocr = None
-
     def mock_import(name: str, *args: Any, **kwargs: Any) -> Any:
         if name == "paddleocr":
             raise ImportError("No module named 'paddleocr'")
@@ -281,8 +283,6 @@ async def test_init_paddle_ocr_missing_dependency(backend: PaddleBackend, mock_f
 
 @pytest.mark.anyio
 async def test_init_paddle_ocr_initialization_error(backend: PaddleBackend, mock_find_spec: Mock) -> None:
-    PaddleBackend._paddle_ocr = None
-
     async def mock_run_sync_error(*args: Any, **_: Any) -> None:
         if args and args[0].__name__ == "PaddleOCR":
             raise Exception("Initialization error")
@@ -295,26 +295,17 @@ async def test_init_paddle_ocr_initialization_error(backend: PaddleBackend, mock
 
 
 @pytest.mark.anyio
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"language": "german", "use_angle_cls": True, "det_db_thresh": 0.4, "det_db_box_thresh": 0.6},
+    ],
+)
 async def test_process_image(
-    backend: PaddleBackend, mock_image: Mock, mock_run_sync: Mock, mock_paddleocr: Mock
+    paddle_backend_with_mock: PaddleBackend, mock_image: Mock, mock_run_sync: Mock, kwargs: dict[str, Any]
 ) -> None:
-    paddle_mock = Mock()
-
-    paddle_mock.ocr.return_value = [
-        [
-            [
-                [[10, 10], [100, 10], [100, 30], [10, 30]],
-                ("Sample text 1", 0.95),
-            ],
-            [
-                [[10, 40], [100, 40], [100, 60], [10, 60]],
-                ("Sample text 2", 0.90),
-            ],
-        ]
-    ]
-    PaddleBackend._paddle_ocr = paddle_mock
-
-    result = await backend.process_image(mock_image)
+    result = await paddle_backend_with_mock.process_image(mock_image, **kwargs)
 
     assert isinstance(result, ExtractionResult)
     assert "Sample text 1 Sample text 2" in result.content
@@ -324,140 +315,41 @@ async def test_process_image(
 
 
 @pytest.mark.anyio
-async def test_process_image_with_options(backend: PaddleBackend, mock_image: Mock, mock_run_sync: Mock) -> None:
-    paddle_mock = Mock()
-
-    paddle_mock.ocr.return_value = [
-        [
-            [
-                [[10, 10], [100, 10], [100, 30], [10, 30]],
-                ("Sample text 1", 0.95),
-            ],
-            [
-                [[10, 40], [100, 40], [100, 60], [10, 60]],
-                ("Sample text 2", 0.90),
-            ],
-        ]
-    ]
-    PaddleBackend._paddle_ocr = paddle_mock
-
-    result = await backend.process_image(
-        mock_image,
-        language="german",
-        use_angle_cls=True,
-        det_db_thresh=0.4,
-        det_db_box_thresh=0.6,
-    )
-
-    assert isinstance(result, ExtractionResult)
-    assert "Sample text 1 Sample text 2" in result.content
-
-
-@pytest.mark.anyio
-async def test_process_image_error(backend: PaddleBackend, mock_image: Mock) -> None:
-    paddle_mock = Mock()
-
-    paddle_mock.ocr.return_value = [
-        [
-            [
-                [[10, 10], [100, 10], [100, 30], [10, 30]],
-                ("Sample text 1", 0.95),
-            ],
-            [
-                [[10, 40], [100, 40], [100, 60], [10, 60]],
-                ("Sample text 2", 0.90),
-            ],
-        ]
-    ]
-    PaddleBackend._paddle_ocr = paddle_mock
-
+async def test_process_image_error(paddle_backend_with_mock: PaddleBackend, mock_image: Mock) -> None:
     with patch("kreuzberg._ocr._paddleocr.run_sync", side_effect=Exception("OCR processing error")):
         with pytest.raises(OCRError) as excinfo:
-            await backend.process_image(mock_image)
+            await paddle_backend_with_mock.process_image(mock_image)
 
         assert "Failed to OCR using PaddleOCR" in str(excinfo.value)
 
 
 @pytest.mark.anyio
-async def test_process_file(backend: PaddleBackend, mock_run_sync: Mock, ocr_image: Path) -> None:
-    paddle_mock = Mock()
-
-    paddle_mock.ocr.return_value = [
-        [
-            [
-                [[10, 10], [100, 10], [100, 30], [10, 30]],
-                ("Sample text 1", 0.95),
-            ],
-            [
-                [[10, 40], [100, 40], [100, 60], [10, 60]],
-                ("Sample text 2", 0.90),
-            ],
-        ]
-    ]
-    PaddleBackend._paddle_ocr = paddle_mock
-
-    result = await backend.process_file(ocr_image)
-
-    assert isinstance(result, ExtractionResult)
-    assert "Sample text 1 Sample text 2" in result.content
-
-
-@pytest.mark.anyio
-async def test_process_file_with_options(backend: PaddleBackend, mock_run_sync: Mock, ocr_image: Path) -> None:
-    paddle_mock = Mock()
-
-    paddle_mock.ocr.return_value = [
-        [
-            [
-                [[10, 10], [100, 10], [100, 30], [10, 30]],
-                ("Sample text 1", 0.95),
-            ],
-            [
-                [[10, 40], [100, 40], [100, 60], [10, 60]],
-                ("Sample text 2", 0.90),
-            ],
-        ]
-    ]
-    PaddleBackend._paddle_ocr = paddle_mock
-
-    result = await backend.process_file(
-        ocr_image,
-        language="french",
-        use_angle_cls=True,
-        det_db_thresh=0.4,
-    )
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"language": "french", "use_angle_cls": True, "det_db_thresh": 0.4},
+    ],
+)
+async def test_process_file(
+    paddle_backend_with_mock: PaddleBackend, mock_run_sync: Mock, ocr_image: Path, kwargs: dict[str, Any]
+) -> None:
+    result = await paddle_backend_with_mock.process_file(ocr_image, **kwargs)
 
     assert isinstance(result, ExtractionResult)
     assert "Sample text 1 Sample text 2" in result.content
 
 
 @pytest.mark.anyio
-async def test_process_file_error(backend: PaddleBackend, ocr_image: Path) -> None:
-    paddle_mock = Mock()
-
-    paddle_mock.ocr.return_value = [
-        [
-            [
-                [[10, 10], [100, 10], [100, 30], [10, 30]],
-                ("Sample text 1", 0.95),
-            ],
-            [
-                [[10, 40], [100, 40], [100, 60], [10, 60]],
-                ("Sample text 2", 0.90),
-            ],
-        ]
-    ]
-    PaddleBackend._paddle_ocr = paddle_mock
-
+async def test_process_file_error(paddle_backend_with_mock: PaddleBackend, ocr_image: Path) -> None:
     with patch("kreuzberg._ocr._paddleocr.run_sync", side_effect=Exception("File processing error")):
         with pytest.raises(OCRError) as excinfo:
-            await backend.process_file(ocr_image)
+            await paddle_backend_with_mock.process_file(ocr_image)
 
         assert "Failed to load or process image using PaddleOCR" in str(excinfo.value)
 
 
-@pytest.mark.anyio
-async def test_process_paddle_result_empty() -> None:
+def test_process_paddle_result_empty() -> None:
     image = Mock(spec=Image.Image)
     image.size = (100, 100)
 
@@ -471,8 +363,7 @@ async def test_process_paddle_result_empty() -> None:
     assert result.metadata.get("height") == 100
 
 
-@pytest.mark.anyio
-async def test_process_paddle_result_empty_page() -> None:
+def test_process_paddle_result_empty_page() -> None:
     image = Mock(spec=Image.Image)
     image.size = (100, 100)
 
@@ -484,8 +375,7 @@ async def test_process_paddle_result_empty_page() -> None:
     assert result.metadata.get("height") == 100
 
 
-@pytest.mark.anyio
-async def test_process_paddle_result_complex() -> None:
+def test_process_paddle_result_complex() -> None:
     image = Mock(spec=Image.Image)
     image.size = (200, 200)
 
@@ -526,8 +416,7 @@ async def test_process_paddle_result_complex() -> None:
     assert result.metadata.get("height") == 200
 
 
-@pytest.mark.anyio
-async def test_process_paddle_result_with_empty_text() -> None:
+def test_process_paddle_result_with_empty_text() -> None:
     image = Mock(spec=Image.Image)
     image.size = (100, 100)
 
@@ -554,8 +443,7 @@ async def test_process_paddle_result_with_empty_text() -> None:
     assert "Valid text" in result.content
 
 
-@pytest.mark.anyio
-async def test_process_paddle_result_with_close_lines() -> None:
+def test_process_paddle_result_with_close_lines() -> None:
     image = Mock(spec=Image.Image)
     image.size = (200, 100)
 
@@ -583,18 +471,10 @@ async def test_process_paddle_result_with_close_lines() -> None:
     assert "Different line" in result.content
 
 
+@requires_paddleocr
+@skip_on_apple_silicon
 @pytest.mark.anyio
 async def test_integration_process_file(backend: PaddleBackend, ocr_image: Path) -> None:
-    try:
-        from paddleocr import PaddleOCR  # noqa: F401
-    except ImportError:
-        pytest.skip("PaddleOCR not installed")
-
-    import platform
-
-    if platform.system() == "Darwin" and platform.machine() == "arm64":
-        pytest.skip("Test not applicable on Mac M1/ARM architecture")
-
     try:
         result = await backend.process_file(ocr_image)
         assert isinstance(result, ExtractionResult)
@@ -603,30 +483,20 @@ async def test_integration_process_file(backend: PaddleBackend, ocr_image: Path)
         pytest.skip("PaddleOCR not properly installed or configured")
 
 
+@requires_paddleocr
+@skip_on_apple_silicon
 @pytest.mark.anyio
-async def test_integration_process_image(backend: PaddleBackend, ocr_image: Path) -> None:
-    try:
-        from paddleocr import PaddleOCR  # noqa: F401
-    except ImportError:
-        pytest.skip("PaddleOCR not installed")
-
-    import platform
-
-    if platform.system() == "Darwin" and platform.machine() == "arm64":
-        pytest.skip("Test not applicable on Mac M1/ARM architecture")
-
+async def test_integration_process_image(backend: PaddleBackend, opened_ocr_image: Image.Image) -> None:
     try:
-        image = Image.open(ocr_image)
-        with image:
-            result = await backend.process_image(image)
-            assert isinstance(result, ExtractionResult)
-            assert result.content.strip()
+        result = await backend.process_image(opened_ocr_image)
+        assert isinstance(result, ExtractionResult)
+        assert result.content.strip()
     except (MissingDependencyError, OCRError):
         pytest.skip("PaddleOCR not properly installed or configured")
 
 
 @pytest.mark.parametrize(
-    "language_code,expected_result",
+    "language_code,expected",
     [
         ("en", "en"),
         ("EN", "en"),
@@ -635,34 +505,28 @@ async def test_integration_process_image(backend: PaddleBackend, ocr_image: Path
         ("german", "german"),
         ("japan", "japan"),
         ("korean", "korean"),
+        ("invalid", ValidationError),
+        ("español", ValidationError),
+        ("русский", ValidationError),
+        ("fra", ValidationError),
+        ("deu", ValidationError),
+        ("jpn", ValidationError),
+        ("kor", ValidationError),
+        ("zho", ValidationError),
+        ("", ValidationError),
+        ("123", ValidationError),
     ],
 )
-def test_validate_language_code_valid(language_code: str, expected_result: str) -> None:
-    result = PaddleBackend._validate_language_code(language_code)
-    assert result == expected_result
-
+def test_validate_language_code(language_code: str, expected: str | type[ValidationError]) -> None:
+    if isinstance(expected, str):
+        assert PaddleBackend._validate_language_code(language_code) == expected
+        return
 
-@pytest.mark.parametrize(
-    "invalid_language_code",
-    [
-        "invalid",
-        "español",
-        "русский",
-        "fra",
-        "deu",
-        "jpn",
-        "kor",
-        "zho",
-        "",
-        "123",
-    ],
-)
-def test_validate_language_code_invalid(invalid_language_code: str) -> None:
-    with pytest.raises(ValidationError) as excinfo:
-        PaddleBackend._validate_language_code(invalid_language_code)
+    with pytest.raises(expected) as excinfo:
+        PaddleBackend._validate_language_code(language_code)
 
     assert "language_code" in excinfo.value.context
-    assert excinfo.value.context["language_code"] == invalid_language_code
+    assert excinfo.value.context["language_code"] == language_code
     assert "supported_languages" in excinfo.value.context
 
     assert "not supported by PaddleOCR" in str(excinfo.value)
@@ -672,13 +536,11 @@ def test_validate_language_code_invalid(invalid_language_code: str) -> None:
 async def test_init_paddle_ocr_with_invalid_language(
     backend: PaddleBackend, mock_find_spec: Mock, mocker: MockerFixture
 ) -> None:
-    PaddleBackend._paddle_ocr = None
-
     validation_error = ValidationError(
         "The provided language code is not supported by PaddleOCR",
         context={
             "language_code": "invalid_language",
-            "supported_languages": ",".join(sorted(PADDLEOCR_SUPPORTED_LANGUAGE_CODES)),
+            "supported_languages": SUPPORTED_LANGUAGES,
         },
     )
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from PIL import Image
@@ -15,101 +15,77 @@ from kreuzberg._types import ExtractionResult
 from kreuzberg.exceptions import MissingDependencyError, OCRError, ValidationError
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
     from pytest_mock import MockerFixture
 
+OCR_OUTPUTS: dict[str, str] = {}
+TESSERACT_OK_RESULT = Mock(stdout=b"tesseract 5.0.0", returncode=0, stderr=b"")
+
 
 @pytest.fixture
 def backend() -> TesseractBackend:
     return TesseractBackend()
 
 
-@pytest.fixture
-def mock_run_process(mocker: MockerFixture) -> Mock:
-    async def async_run_sync(command: list[str], **kwargs: Any) -> Mock:
-        result = Mock()
-        result.stdout = b"tesseract 5.0.0"
-        result.returncode = 0
-        result.stderr = b""
-
-        if "--version" in command and command[0].endswith("tesseract"):
-            return result
-
-        if len(command) >= 3 and command[0].endswith("tesseract"):
-            output_file = command[2]
-            if "test_process_image_with_tesseract_invalid_input" in str(kwargs.get("cwd")):
-                result.returncode = 1
-                result.stderr = b"Error processing file"
-                raise OCRError("Error processing file")
-
-            Path(f"{output_file}.txt").write_text("Sample OCR text")
-            result.returncode = 0
-            return result
-
-        return result
-
-    mock = mocker.patch("kreuzberg._ocr._tesseract.run_process")
-    mock.return_value = Mock()
-    mock.return_value.stdout = b"tesseract 5.0.0"
-    mock.return_value.returncode = 0
-    mock.return_value.stderr = b""
-    mock.side_effect = async_run_sync
-    return mock
+@pytest.fixture(scope="module")
+def blank_image() -> Image.Image:
+    return Image.new("RGB", (100, 100))
 
 
 @pytest.fixture
-def mock_run_process_invalid(mocker: MockerFixture) -> Mock:
-    async def run_sync(command: list[str], **kwargs: Any) -> Mock:
-        result = Mock()
-        result.stdout = b"tesseract 4.0.0"
-        result.returncode = 0
-        result.stderr = b""
-        return result
-
-    mock = mocker.patch("kreuzberg._ocr._tesseract.run_process")
-    mock.return_value = Mock()
-    mock.return_value.stdout = b"tesseract 4.0.0"
-    mock.return_value.returncode = 0
-    mock.side_effect = run_sync
-    return mock
+def mock_run_process(mocker: MockerFixture) -> Mock:
+    async def run_process(command: list[str], **kwargs: Any) -> Mock:
+        if "--version" not in command and len(command) >= 3 and command[0].endswith("tesseract"):
+            OCR_OUTPUTS[f"{command[2]}.txt"] = "Sample OCR text"
 
+        return TESSERACT_OK_RESULT
 
-@pytest.fixture
-def mock_run_process_error(mocker: MockerFixture) -> Mock:
-    async def run_sync(command: list[str], **kwargs: Any) -> Mock:
-        raise FileNotFoundError
+    OCR_OUTPUTS.clear()
+    mocker.patch(
+        "kreuzberg._ocr._tesseract.AsyncPath",
+        side_effect=lambda path: Mock(read_text=AsyncMock(return_value=OCR_OUTPUTS.get(str(path), ""))),
+    )
+    return mocker.patch("kreuzberg._ocr._tesseract.run_process", side_effect=run_process)
 
-    mock = mocker.patch("kreuzberg._ocr._tesseract.run_process")
-    mock.side_effect = run_sync
-    return mock
 
-
-@pytest.mark.anyio
-async def test_validate_tesseract_version(backend: TesseractBackend, mock_run_process: Mock) -> None:
-    await backend._validate_tesseract_version()
-    mock_run_process.assert_called_with(["tesseract", "--version"])
+@pytest.fixture(scope="module", autouse=True)
+def tesseract_version_checked(module_mocker: MockerFixture) -> None:
+    module_mocker.patch("kreuzberg._ocr._tesseract.TesseractBackend._version_checked", True)
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def reset_version_ref(mocker: MockerFixture) -> None:
     mocker.patch("kreuzberg._ocr._tesseract.TesseractBackend._version_checked", False)
 
 
 @pytest.mark.anyio
-async def test_validate_tesseract_version_invalid(
-    backend: TesseractBackend, mock_run_process_invalid: Mock, reset_version_ref: None
+async def test_validate_tesseract_version(
+    backend: TesseractBackend, mock_run_process: Mock, reset_version_ref: None
 ) -> None:
-    with pytest.raises(MissingDependencyError) as excinfo:
-        await backend._validate_tesseract_version()
-
-    error_message = str(excinfo.value)
-    assert "Tesseract version 5" in error_message
-    assert "required" in error_message
+    await backend._validate_tesseract_version()
+    mock_run_process.assert_called_with(["tesseract", "--version"])
 
 
 @pytest.mark.anyio
-async def test_validate_tesseract_version_missing(
-    backend: TesseractBackend, mock_run_process_error: Mock, reset_version_ref: None
+@pytest.mark.parametrize(
+    "side_effect, return_value",
+    [
+        (None, Mock(stdout=b"tesseract 4.0.0", returncode=0, stderr=b"")),
+        (FileNotFoundError, None),
+    ],
+    ids=["unsupported_version", "missing_binary"],
+)
+async def test_validate_tesseract_version_error(
+    backend: TesseractBackend,
+    mock_run_process: Mock,
+    reset_version_ref: None,
+    side_effect: type[Exception] | None,
+    return_value: Mock | None,
 ) -> None:
+    mock_run_process.side_effect = side_effect
+    mock_run_process.return_value = return_value
+
     with pytest.raises(MissingDependencyError) as excinfo:
         await backend._validate_tesseract_version()
 
@@ -119,89 +95,77 @@ async def test_validate_tesseract_version_missing(
 
 
 @pytest.mark.anyio
-async def test_process_file(backend: TesseractBackend, mock_run_process: Mock, ocr_image: Path) -> None:
-    result = await backend.process_file(ocr_image, language="eng", psm=PSMMode.AUTO)
-    assert isinstance(result, ExtractionResult)
-    assert result.content.strip() == "Sample OCR text"
-
-
-@pytest.mark.anyio
-async def test_process_file_with_options(backend: TesseractBackend, mock_run_process: Mock, ocr_image: Path) -> None:
-    result = await backend.process_file(ocr_image, language="eng", psm=PSMMode.AUTO)
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"language": "eng", "psm": PSMMode.AUTO},
+    ],
+)
+async def test_process_file(
+    backend: TesseractBackend, mock_run_process: Mock, ocr_image: Path, kwargs: dict[str, Any]
+) -> None:
+    result = await backend.process_file(ocr_image, **kwargs)
     assert isinstance(result, ExtractionResult)
     assert result.content.strip() == "Sample OCR text"
 
 
-@pytest.mark.anyio
-async def test_process_file_error(backend: TesseractBackend, mock_run_process: Mock, ocr_image: Path) -> None:
-    async def error_side_effect(*args: Any, **kwargs: Any) -> Mock:
-        if args and isinstance(args[0], list) and "--version" in args[0]:
-            result = Mock()
-            result.returncode = 0
-
-            stdout_mock = Mock()
-            stdout_mock.decode = Mock(return_value="tesseract 5.0.0")
-            result.stdout = stdout_mock
-            result.stderr = b""
-            return result
-
-        result = Mock()
-        result.returncode = 1
-        result.stderr = b"Error processing file"
-        return result
-
-    TesseractBackend._version_checked = False
-    mock_run_process.side_effect = error_side_effect
-
-    with pytest.raises(OCRError, match="OCR failed with a non-0 return code"):
-        await backend.process_file(ocr_image, language="eng", psm=PSMMode.AUTO)
-
+def _failing_run_process(error: Exception | None) -> Callable[..., Coroutine[None, None, Mock]]:
+    failed_result = Mock(returncode=1, stderr=b"Error processing file")
 
-@pytest.mark.anyio
-async def test_process_file_runtime_error(backend: TesseractBackend, mock_run_process: Mock, ocr_image: Path) -> None:
-    call_count = 0
+    async def side_effect(command: list[str], **kwargs: Any) -> Mock:
+        if "--version" in command:
+            return TESSERACT_OK_RESULT
 
-    async def runtime_error_side_effect(*args: Any, **kwargs: Any) -> Mock:
-        nonlocal call_count
-        call_count += 1
+        if error is not None:
+            raise error
 
-        if call_count == 1:
-            result = Mock()
-            result.returncode = 0
+        return failed_result
 
-            stdout_mock = Mock()
-            stdout_mock.decode = Mock(return_value="tesseract 5.0.0")
-            result.stdout = stdout_mock
-            result.stderr = b""
-            return result
+    return side_effect
 
-        raise RuntimeError("Command failed")
 
-    TesseractBackend._version_checked = False
-    mock_run_process.side_effect = runtime_error_side_effect
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "error, match",
+    [
+        (None, "OCR failed with a non-0 return code"),
+        (RuntimeError("Command failed"), "Failed to OCR using tesseract"),
+    ],
+    ids=["non_zero_returncode", "runtime_error"],
+)
+async def test_process_file_error(
+    backend: TesseractBackend,
+    mock_run_process: Mock,
+    ocr_image: Path,
+    reset_version_ref: None,
+    error: Exception | None,
+    match: str,
+) -> None:
+    mock_run_process.side_effect = _failing_run_process(error)
 
-    with pytest.raises(OCRError, match="Failed to OCR using tesseract"):
+    with pytest.raises(OCRError, match=match):
         await backend.process_file(ocr_image, language="eng", psm=PSMMode.AUTO)
 
 
 @pytest.mark.anyio
-async def test_process_image(backend: TesseractBackend, mock_run_process: Mock) -> None:
-    image = Image.new("RGB", (100, 100))
-    result = await backend.process_image(image, language="eng", psm=PSMMode.AUTO)
+async def test_process_image(backend: TesseractBackend, mock_run_process: Mock, blank_image: Image.Image) -> None:
+    result = await backend.process_image(blank_image, language="eng", psm=PSMMode.AUTO)
     assert isinstance(result, ExtractionResult)
     assert result.content.strip() == "Sample OCR text"
 
 
 @pytest.mark.anyio
-async def test_process_image_with_tesseract_pillow(backend: TesseractBackend, mock_run_process: Mock) -> None:
-    image = Image.new("RGB", (100, 100))
-    result = await backend.process_image(image)
+async def test_process_image_with_tesseract_pillow(
+    backend: TesseractBackend, mock_run_process: Mock, blank_image: Image.Image
+) -> None:
+    result = await backend.process_image(blank_image)
     assert isinstance(result, ExtractionResult)
     assert result.content.strip() == "Sample OCR text"
 
 
 @pytest.mark.anyio
-async def test_integration_process_file(backend: TesseractBackend, ocr_image: Path) -> None:
+async def test_integration_process_file(backend: TesseractBackend, ocr_image: Path, reset_version_ref: None) -> None:
     result = await backend.process_file(ocr_image, language="eng", psm=PSMMode.AUTO)
     assert isinstance(result, ExtractionResult)
     assert result.content.strip()
@@ -260,28 +224,25 @@ def test_validate_language_code_invalid(invalid_language_code: str) -> None:
 
 
 @pytest.mark.anyio
-async def test_integration_process_image(backend: TesseractBackend, ocr_image: Path) -> None:
-    image = Image.open(ocr_image)
-    with image:
-        result = await backend.process_image(image, language="eng", psm=PSMMode.AUTO)
-        assert isinstance(result, ExtractionResult)
-        assert result.content.strip()
+async def test_integration_process_image(
+    backend: TesseractBackend, opened_ocr_image: Image.Image, reset_version_ref: None
+) -> None:
+    result = await backend.process_image(opened_ocr_image, language="eng", psm=PSMMode.AUTO)
+    assert isinstance(result, ExtractionResult)
+    assert result.content.strip()
 
 
 @pytest.mark.anyio
-async def test_process_file_linux(backend: TesseractBackend, mocker: MockerFixture) -> None:
+async def test_process_file_linux(backend: TesseractBackend, mocker: MockerFixture, reset_version_ref: None) -> None:
     mocker.patch("sys.platform", "linux")
 
+    ocr_result = Mock(stdout=b"test output", returncode=0, stderr=b"")
+
     async def linux_mock_run(*args: Any, **kwargs: Any) -> Mock:
-        result = Mock()
-        result.returncode = 0
-        result.stdout = b"tesseract 5.0.0" if "--version" in args[0] else b"test output"
-        result.stderr = b""
-        return result
+        return TESSERACT_OK_RESULT if "--version" in args[0] else ocr_result
 
     mock_run = mocker.patch("kreuzberg._ocr._tesseract.run_process", side_effect=linux_mock_run)
 
-    TesseractBackend._version_checked = False
     await backend.process_file(Path("test.png"), language="eng", psm=PSMMode.AUTO)
 
     assert any(call[1].get("env") == {"OMP_THREAD_LIMIT": "1"} for call in mock_run.call_args_list)
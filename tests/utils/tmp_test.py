@@ -36,15 +36,13 @@ async def test_create_temp_file_with_content() -> None:
 
 @pytest.mark.anyio
 async def test_create_temp_file_cleanup_error(mocker: MockerFixture) -> None:
-    temp_file_path, cleanup = await create_temp_file(".txt")
-    assert temp_file_path.exists()
-
     mock_path = mocker.Mock()
     mock_path.unlink = mocker.Mock(side_effect=PermissionError("Mock permission error"))
 
     mocker.patch("kreuzberg._utils._tmp.AsyncPath", return_value=mock_path)
 
-    temp_file_path2, cleanup2 = await create_temp_file(".txt")
-    await cleanup2()
-
+    temp_file_path, cleanup = await create_temp_file(".txt")
     await cleanup()
+
+    assert temp_file_path.exists()
+    temp_file_path.unlink()